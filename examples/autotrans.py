@@ -1,11 +1,10 @@
 import logging
 import pathlib
+from typing import Any
 
 import matlab
 import matlab.engine
 import numpy as np
-import plotly.graph_objects as go
-import plotly.subplots as sp
 
 from staliro import Sample, SignalInput, TestOptions, staliro
 from staliro.models import Model, Result
@@ -17,34 +16,63 @@ class AutotransModel(Model[list[float], None]):
     MODEL_NAME = "Autotrans_shift"
 
     def __init__(self) -> None:
+        self.sampling_step = 0.2
+        self.engine: Any = None
+        self.model_opts: Any = None
+        self._time_cache: dict[tuple[float, float], tuple[Any, list[float]]] = {}
+
+    def _start_engine(self) -> None:
         script_path = pathlib.Path(__name__)
 
-        self.sampling_step = 0.2
         self.engine = matlab.engine.start_matlab()
         self.engine.addpath(str(script_path.parent))
 
+        # Keep the model loaded in the engine and enable fast restart so that the model is only
+        # compiled by the first simulation instead of being re-initialized on every call to sim
+        self.engine.load_system(AutotransModel.MODEL_NAME, nargout=0)
+        self.engine.set_param(AutotransModel.MODEL_NAME, "FastRestart", "on", nargout=0)
+
         model_opts = self.engine.simget(AutotransModel.MODEL_NAME)
         self.model_opts = self.engine.simset(model_opts, "SaveFormat", "Array")
 
+    def _times(self, tspan: tuple[float, float]) -> tuple[Any, list[float]]:
+        if tspan not in self._time_cache:
+            tstart, tend = tspan
+            duration = tend - tstart
+            n_times = duration // self.sampling_step
+            signal_times: list[float] = np.linspace(tstart, tend, num=int(n_times)).tolist()
+            self._time_cache[tspan] = (matlab.double([0, tend]), signal_times)
+
+        return self._time_cache[tspan]
+
     def simulate(self, sample: Sample) -> Result[list[float], None]:
         assert sample.signals.tspan is not None
 
-        tstart, tend = sample.signals.tspan
-        duration = tend - tstart
-        sim_t = matlab.double([0, tend])
-        n_times = duration // self.sampling_step
-        signal_times = np.linspace(tstart, tend, num=int(n_times))
-        signal_values = np.array(
-            [[signal.at_time(t) for t in signal_times] for signal in sample.signals]
-        )
+        # The engine is started by the first simulation so that importing or constructing the
+        # model does not pay the MATLAB startup cost
+        if self.engine is None:
+            self._start_engine()
+
+        sim_t, signal_times = self._times(sample.signals.tspan)
+        # The input matrix is built directly in the time-major layout expected by the model, with
+        # the signal times in the first column and one column per input signal
+        signal_matrix = np.empty((len(signal_times), len(sample.signals) + 1), dtype=np.float64)
+        signal_matrix[:, 0] = signal_times
 
-        model_input = matlab.double(np.row_stack((signal_times, signal_values)).T.tolist())
+        for column, signal in enumerate(sample.signals, start=1):
+            signal_matrix[:, column] = signal.at_times(signal_times)
+
+        # matlab.double reads NumPy arrays through the buffer protocol (R2022a+), so the input
+        # matrix is handed over directly instead of being converted into nested Python lists
+        model_input = matlab.double(signal_matrix)
         timestamps, _, data = self.engine.sim(
             self.MODEL_NAME, sim_t, self.model_opts, model_input, nargout=3
         )
 
-        times: list[float] = np.array(timestamps).flatten().tolist()
-        states: list[list[float]] = list(data)
+        # The outputs are read through the buffer protocol as well. The times are only iterated
+        # by the trace, so they stay an array, and the states are converted in a single pass
+        times = np.asarray(timestamps).ravel()
+        states: list[list[float]] = np.asarray(data).tolist()
 
         return Result(times=times, states=states, extra=None)
 
@@ -67,15 +95,19 @@ options = TestOptions(
 )
 
 if __name__ == "__main__":
+    import plotly.graph_objects as go
+    import plotly.subplots as sp
+
     logging.basicConfig(level=logging.DEBUG)
 
     runs = staliro(model, specification, optimizer, options)
     run = runs[0]
-    min_eval = min(run.evaluations, key=lambda e: e.cost)
+    min_eval = run.best_eval
 
     times = list(min_eval.extra.trace.times)
-    rpm = [state[0] for state in min_eval.extra.trace.states]
-    speed = [state[1] for state in min_eval.extra.trace.states]
+    states = np.array(list(min_eval.extra.trace.states))
+    rpm = states[:, 0]
+    speed = states[:, 1]
 
     figure = sp.make_subplots(rows=2, cols=1, shared_xaxes=True, x_title="Time (s)")
     figure.add_trace(go.Scatter(x=times, y=rpm), row=1, col=1)
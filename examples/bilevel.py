@@ -10,43 +10,45 @@ import staliro.optimizers as optimizers
 import staliro.specifications as specifications
 
 TSPAN = (0, 15)
+SPEC = specifications.rtamt.parse_dense("always (alt >= 0)", {"alt": 0})
+
+
+def simulate(alt: float, phi: float, theta: float, psi: float) -> models.Trace[list[float]]:
+    power = 9
+    alpha = math.radians(2.1215)
+    beta = 0
+    vel = 540
+
+    initial_state = [vel, alpha, beta, phi, theta, psi, 0, 0, 0, 0, 0, 0, alt, power]
+    step = 1.0 / 30.0
+    system = autopilot.GcasAutopilot(init_mode="roll", stdout=False)
+    result = f16_sim.run_f16_sim(initial_state, TSPAN[1], system, step, extended_states=True)
+    states = np.empty((len(result["times"]), 5), dtype=float)
+    states[:, 0] = np.asarray(result["modes"]) != "standby"
+    states[:, 1:] = result["states"][:, (4, 5, 6, 12)]  # roll, pitch, yaw, altitude
+
+    return models.Trace(times=result["times"], states=states.tolist())
 
 
 @staliro.costfunc()
 def outer(sample: staliro.Sample) -> float:
+    alt = sample.static["alt"]
+
     @models.blackbox(step_size=0.1)
     def inner(inputs: models.Blackbox.Inputs) -> models.Trace[list[float]]:
-        power = 9
-        alpha = np.deg2rad(2.1215)
-        beta = 0
-        alt = sample.static["alt"]
-        vel = 540
-        phi = inputs.static["phi"]
-        theta = inputs.static["theta"]
-        psi = inputs.static["psi"]
-
-        initial_state = [vel, alpha, beta, phi, theta, psi, 0, 0, 0, 0, 0, 0, alt, power]
-        step = 1.0 / 30.0
-        system = autopilot.GcasAutopilot(init_mode="roll", stdout=False)
-        result = f16_sim.run_f16_sim(initial_state, TSPAN[1], system, step, extended_states=True)
-        states = np.vstack(
-            (
-                np.array([0 if x == "standby" else 1 for x in result["modes"]]),
-                result["states"][:, 4],  # roll
-                result["states"][:, 5],  # pitch
-                result["states"][:, 6],  # yaw
-                result["states"][:, 12],  # altitude
-            )
+        return simulate(
+            alt=alt,
+            phi=inputs.static["phi"],
+            theta=inputs.static["theta"],
+            psi=inputs.static["psi"],
         )
 
-        return models.Trace(times=result["times"], states=np.transpose(states).tolist())
-
-    spec = specifications.rtamt.parse_dense("always (alt >= 0)", {"alt": 0})
     optimizer = optimizers.UniformRandom[float]()
     options = staliro.TestOptions(
         runs=1,
         tspan=TSPAN,
         iterations=500,
+        processes="cores",
         static_inputs={
             "phi": math.pi / 4 + np.array([-math.pi / 20, math.pi / 30]),
             "theta": -math.pi / 2 * 0.8 + np.array([0, math.pi / 20]),
@@ -54,10 +56,10 @@ def outer(sample: staliro.Sample) -> float:
         },
     )
 
-    results = staliro.test(inner, spec, optimizer, options)
+    results = staliro.test(inner, SPEC, optimizer, options)
     result = results[0]
 
-    return min(e.cost for e in result.evaluations)
+    return result.best_eval.cost
 
 
 if __name__ == "__main__":
@@ -70,6 +72,6 @@ if __name__ == "__main__":
 
     results = staliro.test(outer, optimizer, options)
     result = results[0]
-    min_cost = min(e.cost for e in result.evaluations)
+    min_cost = result.best_eval.cost
 
     print(f"Minimum cost found: {min_cost}")
@@ -3,7 +3,6 @@ import math
 from typing import Final
 
 import numpy as np
-import plotly.graph_objects as go
 from aerobench.examples.gcas.gcas_autopilot import GcasAutopilot
 from aerobench.run_f16_sim import run_f16_sim
 
@@ -30,17 +29,11 @@ def f16_model(inputs: Blackbox.Inputs) -> Trace[list[float]]:
     step = 1.0 / 30.0
     autopilot = GcasAutopilot(init_mode="roll", stdout=False)
     result = run_f16_sim(initial_state, TSPAN[1], autopilot, step, extended_states=True)
-    states = np.vstack(
-        (
-            np.array([0 if x == "standby" else 1 for x in result["modes"]]),
-            result["states"][:, 4],  # roll
-            result["states"][:, 5],  # pitch
-            result["states"][:, 6],  # yaw
-            result["states"][:, 12],  # altitude
-        )
-    )
+    states = np.empty((len(result["times"]), 5), dtype=float)
+    states[:, 0] = np.asarray(result["modes"]) != "standby"
+    states[:, 1:] = result["states"][:, (4, 5, 6, 12)]  # roll, pitch, yaw, altitude
 
-    return Trace(times=result["times"], states=np.transpose(states).tolist())
+    return Trace(times=result["times"], states=states.tolist())
 
 
 spec = rtamt.parse_dense("always (alt > 0)", {"alt": 4})
@@ -57,11 +50,13 @@ options = TestOptions(
 )
 
 if __name__ == "__main__":
+    import plotly.graph_objects as go
+
     logging.basicConfig(level=logging.DEBUG)
 
     runs = staliro(f16_model, spec, optimizer, options)
     run = runs[0]
-    min_cost_eval = min(run.evaluations, key=lambda e: e.cost)
+    min_cost_eval = run.best_eval
     min_cost_trace = min_cost_eval.extra.trace
 
     figure = go.Figure()
@@ -70,7 +65,7 @@ if __name__ == "__main__":
     figure.add_trace(
         go.Scatter(
             x=list(min_cost_trace.times),
-            y=[state[4] for state in min_cost_trace.states],
+            y=np.array(list(min_cost_trace.states))[:, 4],
             mode="lines",
             line_color="green",
             name="altitude",
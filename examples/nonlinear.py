@@ -1,7 +1,7 @@
 import logging
 import math
 
-import plotly.graph_objects as go
+import numpy as np
 
 import staliro
 import staliro.models as models
@@ -9,20 +9,23 @@ import staliro.optimizers as optimizers
 import staliro.specifications as specifications
 
 
+def derivatives(t: float, x1: float, x2: float) -> tuple[float, float]:
+    x1_dot = x1 - x2 + 0.1 * t
+    x2_dot = x2 * math.cos(2 * math.pi * x1) + 0.1 * t
+
+    return x1_dot, x2_dot
+
+
 @models.ode()
 def nonlinear_model(inputs: models.Ode.Inputs) -> dict[str, float]:
-    x1 = inputs.state["x1"]
-    x2 = inputs.state["x2"]
+    x1_dot, x2_dot = derivatives(inputs.time, inputs.state["x1"], inputs.state["x2"])
 
-    return {
-        "x1": x1 - x2 + 0.1 * inputs.time,  # x1_dot
-        "x2": x2 * math.cos(2 * math.pi * x1) + 0.1 * inputs.time,  # x2_dot
-    }
+    return {"x1": x1_dot, "x2": x2_dot}
 
 
 phi = r"always !(a >= -1.6 and a <= -1.4  and b >= -1.1 and b <= -0.9)"
 specification = specifications.rtamt.parse_dense(phi, {"a": 0, "b": 1})
-optimizer = optimizers.UniformRandom[float]()
+optimizer = optimizers.UniformRandom[float](min_cost=0.0)
 options = staliro.TestOptions(
     runs=1,
     iterations=100,
@@ -34,11 +37,14 @@ options = staliro.TestOptions(
 )
 
 if __name__ == "__main__":
+    import plotly.graph_objects as go
+
     logging.basicConfig(level=logging.DEBUG)
 
     runs = staliro.test(nonlinear_model, specification, optimizer, options)
     run = runs[0]
-    min_eval = min(run.evaluations, key=lambda e: e.cost)
+    min_eval = run.best_eval
+    states = np.array(list(min_eval.extra.trace.states))
 
     figure = go.Figure()
     figure.add_trace(
@@ -78,8 +84,8 @@ if __name__ == "__main__":
     figure.add_trace(
         go.Scatter(
             name="Best evaluation trajectory",
-            x=[state[0] for state in min_eval.extra.trace.states],
-            y=[state[1] for state in min_eval.extra.trace.states],
+            x=states[:, 0],
+            y=states[:, 1],
             mode="lines+markers",
             line=go.scatter.Line(color="blue", shape="spline"),
         )
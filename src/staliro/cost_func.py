@@ -30,10 +30,11 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
 from typing import Any, Generic, TypeVar, Union, overload
 
 from attrs import frozen
-from numpy import linspace, ndarray
+from numpy import asarray, linspace, ndarray
 from numpy.typing import NDArray
 from typing_extensions import ParamSpec, TypeAlias
 
@@ -59,6 +60,14 @@ class Result(Generic[C, E]):
     extra: E
 
 
+# Time grids only depend on the test options, so each one is computed once and the same immutable
+# tuple is shared by every sample
+@lru_cache(maxsize=128)
+def _time_grid(tstart: float, tend: float, num: int, *, endpoint: bool) -> tuple[float, ...]:
+    times = linspace(tstart, tend, endpoint=endpoint, num=num, dtype=float)
+    return tuple(times.tolist())
+
+
 def _parse_signals(values: list[float], opts: TestOptions) -> dict[str, Signal]:
     if len(opts.signals) == 0:
         return {}
@@ -69,13 +78,12 @@ def _parse_signals(values: list[float], opts: TestOptions) -> dict[str, Signal]:
     signals: dict[str, Signal] = {}
     signal_start = 0
 
-    for name in opts.signals:
-        signal = opts.signals[name]
+    for name, signal in opts.signals.items():
         n_vals = len(signal.control_points)
+        signal_times: Iterable[float]
 
         if isinstance(signal.control_points, list):
-            times = linspace(tstart, tend, endpoint=False, num=n_vals, dtype=float)
-            signal_times: list[float] = times.tolist()
+            signal_times = _time_grid(tstart, tend, n_vals, endpoint=False)
         else:
             signal_times = list(signal.control_points.keys())
 
@@ -101,6 +109,8 @@ class Signals:
     :param opts: The test options containing the signal configurations
     """
 
+    __slots__ = ("_tspan", "_signals")
+
     def __init__(self, values: list[float], opts: TestOptions):
         self._tspan = opts.tspan
         self._signals = _parse_signals(values, opts)
@@ -142,9 +152,11 @@ class Sample:
     :param opts: The options provided to the test
     """
 
+    __slots__ = ("_values", "_static", "_signals")
+
     def __init__(self, values: SampleLike, opts: TestOptions):
         if isinstance(values, ndarray):
-            self._values: list[float] = values.astype(dtype=float).tolist()
+            self._values: list[float] = asarray(values, dtype=float).tolist()
         else:
             self._values = list(values)
 
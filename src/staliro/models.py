@@ -76,17 +76,18 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable, Iterator, Mapping
+from itertools import repeat
 from math import floor
-from typing import Generic, Literal, SupportsFloat, TypeVar, Union, cast, overload
+from typing import Any, Generic, Literal, SupportsFloat, TypeVar, Union, cast, overload
 
 from attrs import frozen
-from numpy import array, float_, linspace
-from numpy.typing import NDArray
+from numpy import array, float_, ndarray
+from numpy.typing import ArrayLike, NDArray
 from scipy import integrate
 from sortedcontainers import SortedDict
 from typing_extensions import TypeAlias
 
-from .cost_func import FuncWrapper, Sample
+from .cost_func import FuncWrapper, Sample, _time_grid
 from .cost_func import Result as _Result
 
 S = TypeVar("S", covariant=True)
@@ -122,14 +123,23 @@ class Trace(Generic[S], Iterable[tuple[float, S]]):
         states: Iterable[S] | None = None,
     ):
         if isinstance(times, Mapping):
-            self.elements = SortedDict({float(time): state for time, state in times.items()})
+            self.elements = SortedDict(zip(map(float, times.keys()), times.values()))
         else:
             if states is None:
                 raise ValueError("must provide states with times")
 
-            self.elements = SortedDict({float(time): state for time, state in zip(times, states)})
+            # Convert array times in a single call rather than boxing each element individually
+            if isinstance(times, ndarray):
+                keys: Iterable[float] = times.astype(float, copy=False).tolist()
+            else:
+                keys = map(float, times)
+
+            self.elements = SortedDict(zip(keys, states))
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Trace):
             return NotImplemented
 
@@ -291,11 +301,14 @@ class Blackbox(Model[S, E]):
             duration = tend - tstart
             step_count = floor(duration / self.step_size) + 1
 
-            times: list[float] = linspace(tstart, tend, num=step_count, dtype=float).tolist()
-            signals = {
-                time: {name: sample.signals[name].at_time(time) for name in sample.signals.names}
-                for time in times
-            }
+            times = _time_grid(tstart, tend, step_count, endpoint=True)
+            names = list(sample.signals.names)
+            columns = [sample.signals[name].at_times(times) for name in names]
+
+            # Transpose the per-signal columns into per-time rows in one pass instead of indexing
+            # every column for every time. Without any signals every time maps to an empty row.
+            rows = zip(*columns) if columns else repeat(())
+            signals = {time: dict(zip(names, row)) for time, row in zip(times, rows)}
         else:
             signals = {}
 
@@ -383,6 +396,8 @@ class Ode(Model[list[float], None]):
     :param func: User-defined function which is given a `Ode.Inputs` value and returns the
                  derivative of each state variable.
     :param method: The integration method for the ODE solver
+    :param jac: Optional function which is given a `Ode.Inputs` value and returns the Jacobian
+                matrix of the derivatives with respect to the state variables
     """
 
     Method: TypeAlias = Literal["RK45", "RK23", "DOP853", "Radau", "BDF", "LSODA"]
@@ -400,43 +415,65 @@ class Ode(Model[list[float], None]):
         state: dict[str, float]
         signals: dict[str, float]
 
-    def __init__(self, func: Callable[[Ode.Inputs], Mapping[str, float]], method: Ode.Method):
+    Jacobian: TypeAlias = Callable[["Ode.Inputs"], ArrayLike]
+
+    def __init__(
+        self,
+        func: Callable[[Ode.Inputs], Mapping[str, float]],
+        method: Ode.Method,
+        jac: Ode.Jacobian | None = None,
+    ):
         self.func = func
         self.method = method
+        self.jac = jac
 
     def simulate(self, sample: Sample) -> Result[list[float], None]:
         if sample.signals.tspan is None:
             raise RuntimeError("ODE model requires tspan to be defined in TestOptions")
 
         names = list(sample.static)
+        signal_inputs = [(name, sample.signals[name]) for name in sample.signals.names]
+
+        def make_inputs(time: float, state: NDArray[float_]) -> Ode.Inputs:
+            static = dict(zip(names, state.tolist()))
+            signals = {name: signal.at_time(time) for name, signal in signal_inputs}
+
+            return Ode.Inputs(time, static, signals)
 
         def integration_fn(time: float, state: NDArray[float_]) -> NDArray[float_]:
-            static = {name: state[idx] for idx, name in enumerate(sample.static)}
-            signals = {name: sample.signals[name].at_time(time) for name in sample.signals.names}
-            derivs = self.func(Ode.Inputs(time, static, signals))
+            derivs = self.func(make_inputs(time, state))
 
             return array([derivs[name] for name in names])
 
+        def jacobian_fn(time: float, state: NDArray[float_]) -> ArrayLike:
+            assert self.jac is not None
+            return self.jac(make_inputs(time, state))
+
+        # The jacobian is only given to the solver if provided because the explicit methods warn
+        # about any jac argument, even if it is None
+        options: dict[str, Any] = {"jac": jacobian_fn} if self.jac else {}
         integration = integrate.solve_ivp(
             fun=integration_fn,
             t_span=sample.signals.tspan,
             y0=[sample.static[name] for name in names],
             method=self.method,
+            **options,
         )
 
         return Result(
             times=integration.t.tolist(),
-            states=integration.y.T.astype(dtype=float).tolist(),
+            states=integration.y.T.astype(float, copy=False).tolist(),
             extra=None,
         )
 
 
 class OdeDecorator:
-    def __init__(self, method: Ode.Method):
+    def __init__(self, method: Ode.Method, jac: Ode.Jacobian | None = None):
         self.method = method
+        self.jac = jac
 
     def __call__(self, func: Callable[[Ode.Inputs], Mapping[str, float]]) -> Ode:
-        return Ode(func, self.method)
+        return Ode(func, self.method, self.jac)
 
 
 @overload
@@ -444,11 +481,14 @@ def ode(
     func: Callable[[Ode.Inputs], Mapping[str, float]],
     *,
     method: Ode.Method = ...,
+    jac: Ode.Jacobian | None = ...,
 ) -> Ode: ...
 
 
 @overload
-def ode(func: None = ..., *, method: Ode.Method = ...) -> OdeDecorator:
+def ode(
+    func: None = ..., *, method: Ode.Method = ..., jac: Ode.Jacobian | None = ...
+) -> OdeDecorator:
     pass
 
 
@@ -456,6 +496,7 @@ def ode(
     func: Callable[[Ode.Inputs], Mapping[str, float]] | None = None,
     *,
     method: Ode.Method = "RK45",
+    jac: Ode.Jacobian | None = None,
 ) -> Ode | OdeDecorator:
     """Create an `Ode` model from a function.
 
@@ -467,10 +508,13 @@ def ode(
     :param func: The function representing the system ODE
     :param method: The integration method for the ODE solver.
                    Valid options are: ``["RK45", "RK23", "DOP853", "Radau", "BDF", "LSODA"]``
+    :param jac: The Jacobian of the system ODE. Each row corresponds to the derivative of a state
+                variable and each column to a state variable, both in the order of the static
+                inputs. Only used by the ``"Radau"``, ``"BDF"``, and ``"LSODA"`` methods.
     :returns: An ``Ode`` model or a decorator to create an ``Ode`` model
     """
 
-    decorator = OdeDecorator(method)
+    decorator = OdeDecorator(method, jac)
 
     if func:
         return decorator(func)
@@ -65,7 +65,7 @@ from collections.abc import Iterable, Sequence
 from typing import Generic, Literal, Protocol, TypeVar, overload
 
 from attrs import frozen
-from numpy import float_
+from numpy import array, float_
 from numpy.random import Generator, default_rng
 from numpy.typing import NDArray
 from scipy import optimize
@@ -155,8 +155,9 @@ class Comparable(Protocol):
 CT = TypeVar("CT", bound=Comparable)
 
 
-def _sample_uniform(bounds: Iterable[Interval], rng: Generator) -> list[float]:
-    return [rng.uniform(bound[0], bound[1]) for bound in bounds]
+def _sample_uniform(bounds: Sequence[Interval], rng: Generator, count: int) -> NDArray[float_]:
+    lower, upper = array(bounds, dtype=float).T
+    return rng.uniform(lower, upper, size=(count, len(bounds)))
 
 
 def _minimize(samples: Samples, func: ObjFunc[object]) -> None:
@@ -167,21 +168,23 @@ def _falsify(samples: Samples, func: ObjFunc[CT], min_cost: CT | None, max_cost:
     for sample in samples:
         cost = func.eval_sample(sample)
 
-        if min_cost and cost < min_cost:
+        if min_cost is not None and cost < min_cost:
             break
 
-        if max_cost and cost > max_cost:
+        if max_cost is not None and cost > max_cost:
             break
 
 
 class UniformRandom(Optimizer[CT, None]):
     """Optimizer that samples the input space uniformly.
 
-    This optimizer will exhaust the sample budget unless the ``min_cost`` argument is provided. If a
-    minimum cost is indicated then the optimizer will terminate early if a cost is found below that
-    value.
+    This optimizer will exhaust the sample budget unless the ``min_cost`` or ``max_cost`` arguments
+    are provided. If a minimum cost is indicated then the optimizer will terminate early if a cost is
+    found below that value. Similarly, if a maximum cost is indicated then the optimizer will
+    terminate early if a cost is found above that value.
 
     :param min_cost: The minimum cost that will cause the optimize to terminate
+    :param max_cost: The maximum cost that will cause the optimize to terminate
     """
 
     def __init__(self, min_cost: CT | None = None, max_cost: CT | None = None):
@@ -190,9 +193,9 @@ class UniformRandom(Optimizer[CT, None]):
 
     def optimize(self, func: ObjFunc[CT], params: Optimizer.Params) -> None:
         rng = default_rng(params.seed)
-        samples = [_sample_uniform(params.input_bounds, rng) for _ in range(params.budget)]
+        samples = _sample_uniform(params.input_bounds, rng, params.budget)
 
-        if self.min_cost or self.max_cost:
+        if self.min_cost is not None or self.max_cost is not None:
             return _falsify(samples, func, self.min_cost, self.max_cost)
 
         return _minimize(samples, func)
@@ -230,13 +233,10 @@ class DualAnnealing(Optimizer[float, DualAnnealingResult]):
 
     def optimize(self, func: ObjFunc[float], params: Optimizer.Params) -> DualAnnealingResult:
         def listener(sample: object, cost: float, ctx: Literal[-1, 0, 1]) -> bool:
-            if self.min_cost and cost < self.min_cost:
-                return True
-
-            return False
+            return self.min_cost is not None and cost < self.min_cost
 
         result = optimize.dual_annealing(
-            func=lambda x: func.eval_sample(x),
+            func=func.eval_sample,
             bounds=list(params.input_bounds),
             seed=params.seed,
             maxfun=params.budget,
@@ -71,6 +71,7 @@ class TestOptions:
     :param runs: The number times to run the optimizer
     :param processes: Number of processes to use to parallelize sample evaluation
     :param threads: Number of threads to use to parallelize sample evaluation
+    :param cache_size: Number of sample evaluations to remember during a run, 0 disables caching
     """
 
     tspan: Interval | None = field(
@@ -113,6 +114,11 @@ class TestOptions:
         validator=_parallelization,
     )
 
+    cache_size: int = field(
+        default=0,
+        validator=[validators.instance_of(int), validators.ge(0)],
+    )
+
     @tspan.validator
     def _tspan(self, _: AnyAttr, tspan: Interval) -> None:
         if tspan and tspan[0] >= tspan[1]:
@@ -198,6 +198,17 @@ class Delayed(Signal):
 
         return self.signal.at_time(t)
 
+    def at_times(self, ts: Sequence[float]) -> list[float]:
+        times = np.asarray(ts, dtype=float)
+        values = np.zeros_like(times)
+        active = ~(times < self.cutoff)
+
+        # Only the times after the cutoff are evaluated by the inner signal, in a single batch
+        if active.any():
+            values[active] = self.signal.at_times(times[active].tolist())
+
+        return cast(list[float], values.tolist())
+
 
 @frozen(slots=True)
 class DelayedFactory(SignalFactory):
@@ -235,6 +246,21 @@ class Sequenced(Signal):
     def at_time(self, t: float) -> float:
         return self.s1.at_time(t) if t < self.t_switch else self.s2.at_time(t)
 
+    def at_times(self, ts: Sequence[float]) -> list[float]:
+        times = np.asarray(ts, dtype=float)
+        values = np.empty_like(times)
+        first = times < self.t_switch
+        second = ~first
+
+        # Each signal is only evaluated over its own portion of the times, in a single batch
+        if first.any():
+            values[first] = self.s1.at_times(times[first].tolist())
+
+        if second.any():
+            values[second] = self.s2.at_times(times[second].tolist())
+
+        return cast(list[float], values.tolist())
+
 
 @frozen(slots=True)
 class SequencedFactory(SignalFactory):
@@ -243,12 +269,13 @@ class SequencedFactory(SignalFactory):
     t_switch: float
 
     def __call__(self, times: Iterable[float], control_points: Iterable[float]) -> Signal:
-        times_pts = zip(times, control_points)
+        # The pairs are materialized because they are partitioned in two passes
+        times_pts = list(zip(times, control_points))
         s1_data = [(time, value) for time, value in times_pts if time < self.t_switch]
-        s1 = self.first((time for time, _ in s1_data), (value for _, value in s1_data))
+        s1 = self.first([time for time, _ in s1_data], [value for _, value in s1_data])
 
         s2_data = [(time, value) for time, value in times_pts if time >= self.t_switch]
-        s2 = self.second((time for time, _ in s2_data), (value for _, value in s2_data))
+        s2 = self.second([time for time, _ in s2_data], [value for _, value in s2_data])
 
         return Sequenced(s1, s2, self.t_switch)
 
@@ -284,6 +311,15 @@ class Harmonic(Signal):
     def at_time(self, time: float) -> float:
         return self.bias + sum(component.at_time(time) for component in self.components)
 
+    def at_times(self, times: Sequence[float]) -> list[float]:
+        ts = np.asarray(times, dtype=float)
+        values = np.full_like(ts, self.bias)
+
+        for component in self.components:
+            values += component.theta * np.cos(component.omega * ts - component.phi)
+
+        return cast(list[float], values.tolist())
+
 
 def harmonic(_: Iterable[float], control_points: Iterable[float]) -> Harmonic:
     """Create a signal that is the sum of multiple sinusoidal components.
@@ -322,6 +358,10 @@ class Clamped(Signal):
     def at_time(self, time: float) -> float:
         return min(self.hi, max(self.lo, self.signal.at_time(time)))
 
+    def at_times(self, times: Sequence[float]) -> list[float]:
+        values = np.clip(self.signal.at_times(times), self.lo, self.hi)
+        return cast(list[float], values.tolist())
+
 
 @frozen(slots=True)
 class ClampedFactory(SignalFactory):
@@ -331,8 +371,8 @@ class ClampedFactory(SignalFactory):
 
     def __call__(self, times: Iterable[float], control_points: Iterable[float]) -> Signal:
         signal = self.inner(times, control_points)
-        lo = self.lo or -math.inf
-        hi = self.hi or math.inf
+        lo = -math.inf if self.lo is None else self.lo
+        hi = math.inf if self.hi is None else self.hi
 
         return Clamped(signal, lo, hi)
 
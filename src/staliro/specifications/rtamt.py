@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from threading import Lock
 from typing import Union, cast, overload
 
 from rtamt import StlDenseTimeSpecification, StlDiscreteTimeSpecification
@@ -13,6 +15,8 @@ from .specification import Specification
 _Times: TypeAlias = list[float]
 _States: TypeAlias = dict[str, list[float]]
 
+_spec_lock = Lock()
+
 
 @overload
 def _parse_trace(trace: Trace[dict[str, float]]) -> tuple[_Times, _States]: ...
@@ -46,22 +50,34 @@ def _parse_trace(
     return times, states
 
 
+@lru_cache(maxsize=64)
+def _parse_discrete(
+    formula: str, names: tuple[str, ...], period: float
+) -> StlDiscreteTimeSpecification:
+    spec = StlDiscreteTimeSpecification()
+    spec.spec = formula
+
+    for name in names:
+        spec.declare_var(name, "float")
+
+    spec.set_sampling_period(period, "s", 0.1)
+    spec.parse()
+
+    return spec
+
+
 def _evaluate_discrete(formula: str, times: list[float], states: dict[str, list[float]]) -> float:
     try:
         period = times[1] - times[0]
     except IndexError as e:
         raise ValueError("trace must have at least two states to be evaluated") from e
 
-    spec = StlDiscreteTimeSpecification()
-    spec.spec = formula
+    spec = _parse_discrete(formula, tuple(states), round(period, 2))
 
-    for name in states:
-        spec.declare_var(name, "float")
+    # Parsed specifications are shared, and RTAMT stores the evaluated signals on the AST
+    with _spec_lock:
+        robustness = spec.evaluate({"time": times, **states})
 
-    spec.set_sampling_period(round(period, 2), "s", 0.1)
-    spec.parse()
-
-    robustness = spec.evaluate({"time": times, **states})
     return robustness[0][1]
 
 
@@ -144,17 +160,26 @@ def parse_discrete(formula: str, columns: Mapping[str, int] | None = None) -> Di
     return DiscreteNamed(formula)
 
 
-def _evaluate_dense(phi: str, times: list[float], states: dict[str, list[float]]) -> float:
+@lru_cache(maxsize=64)
+def _parse_dense(phi: str, names: tuple[str, ...]) -> StlDenseTimeSpecification:
     spec = StlDenseTimeSpecification()
     spec.spec = phi
 
-    for name in states:
+    for name in names:
         spec.declare_var(name, "float")
 
     spec.parse()
 
+    return spec
+
+
+def _evaluate_dense(phi: str, times: list[float], states: dict[str, list[float]]) -> float:
+    spec = _parse_dense(phi, tuple(states))
     traces = [(name, list(zip(times, states[name]))) for name in states]
-    robustness = spec.evaluate(*traces)
+
+    # Parsed specifications are shared, and RTAMT stores the evaluated signals on the AST
+    with _spec_lock:
+        robustness = spec.evaluate(*traces)
 
     return robustness[0][1]
 
@@ -173,6 +198,11 @@ class DenseMapped(Specification[Sequence[float], float, None]):
         self.requirement = requirement
         self.columns = columns
 
+        # The variable names are known up front, so the formula is parsed once here. This reports
+        # syntax errors when the specification is created and caches the parsed formula for every
+        # evaluation in this process.
+        _parse_dense(requirement, tuple(columns))
+
     def evaluate(self, trace: Trace[Sequence[float]]) -> Result[float, None]:
         times, states = _parse_trace(trace, self.columns)
         cost = _evaluate_dense(self.requirement, times, states)
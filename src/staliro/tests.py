@@ -14,14 +14,16 @@ space.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable, Iterator
 from enum import IntEnum
-from logging import Logger, NullHandler, getLogger
+from logging import NullHandler, getLogger
 from os import cpu_count
 from typing import Generic, Literal, TypeVar, cast, overload
 from uuid import UUID, uuid4
 
 from attrs import define, field, frozen
+from numpy import asarray, ndarray
 from numpy.random import default_rng
 from pathos import pools
 from pathos.abstract_launcher import AbstractWorkerPool
@@ -29,7 +31,7 @@ from typing_extensions import TypeAlias
 
 from .cost_func import CostFunc, Result, Sample, SampleLike
 from .models import Model, Trace
-from .optimizers import ObjFunc, Optimizer
+from .optimizers import Comparable, ObjFunc, Optimizer
 from .options import Interval, TestOptions
 from .specifications import Specification
 
@@ -45,6 +47,7 @@ R = TypeVar("R")
 E = TypeVar("E")
 E1 = TypeVar("E1")
 E2 = TypeVar("E2")
+CT = TypeVar("CT", bound=Comparable)
 
 
 class TestError(Exception):
@@ -65,14 +68,14 @@ class Evaluation(Generic[C, E]):
     extra: E
 
 
-def _cost_func_logger() -> Logger:
-    logger = getLogger("staliro.evaluations")
-    logger.addHandler(NullHandler())
+def _sample_key(values: SampleLike) -> tuple[float, ...]:
+    if isinstance(values, ndarray):
+        return tuple(asarray(values, dtype=float).tolist())
 
-    return logger
+    return tuple(values)
 
 
-@define(slots=True)
+@define(slots=True, eq=False)
 class CostFuncWrapper(Generic[C, E], ObjFunc[C]):
     """Wrapper to transform a `CostFunc` into an `ObjFunc`.
 
@@ -83,23 +86,81 @@ class CostFuncWrapper(Generic[C, E], ObjFunc[C]):
     _func: CostFunc[C, E] = field()
     _options: TestOptions = field()
     _evaluations: list[Evaluation[C, E]] = field(init=False, factory=list)
+    _cache: OrderedDict[tuple[float, ...], Evaluation[C, E]] = field(
+        init=False, factory=OrderedDict
+    )
+
+    def _lookup(self, key: tuple[float, ...]) -> Evaluation[C, E] | None:
+        evaluation = self._cache.get(key)
+
+        if evaluation is not None:
+            self._cache.move_to_end(key)
+            _eval_logger.debug("Using cached evaluation for sample: %s", key)
+
+        return evaluation
+
+    def _cached(self, sample: Sample) -> Evaluation[C, E] | None:
+        if not self._options.cache_size:
+            return None
+
+        evaluation = self._lookup(tuple(sample.values))
+
+        if evaluation is None:
+            return None
+
+        return Evaluation(sample, evaluation.cost, evaluation.extra)
+
+    def _store(self, evaluation: Evaluation[C, E]) -> None:
+        if not self._options.cache_size:
+            return
+
+        self._cache[tuple(evaluation.sample.values)] = evaluation
+
+        if len(self._cache) > self._options.cache_size:
+            self._cache.popitem(last=False)
 
     def eval_sample(self, sample: SampleLike) -> C:
         s = Sample(sample, self._options)
+        evaluation = self._cached(s)
 
-        _eval_logger.debug(f"Evaluating sample: {s.values}")
-        result = self._func.evaluate(s)
+        if evaluation is None:
+            # Lazy formatting so the sample is only converted to a string if the message is emitted
+            _eval_logger.debug("Evaluating sample: %s", s.values)
+            result = self._func.evaluate(s)
 
-        if not isinstance(result, Result):
-            raise TypeError("Cost function must return value of type Result")
+            if not isinstance(result, Result):
+                raise TypeError("Cost function must return value of type Result")
+
+            evaluation = Evaluation(s, result.value, result.extra)
+            self._store(evaluation)
 
-        evaluation = Evaluation(s, result.value, result.extra)
         self._evaluations.append(evaluation)
 
         return evaluation.cost
 
 
-@define(slots=True)
+@frozen(slots=True, eq=False)
+class _Evaluator(Generic[C, E]):
+    """Picklable evaluation function for worker processes.
+
+    Only the cost function and options are sent to the workers, rather than the wrapper which holds
+    the pool and every previous evaluation.
+    """
+
+    func: CostFunc[C, E]
+    options: TestOptions
+
+    def __call__(self, values: SampleLike) -> Evaluation[C, E]:
+        sample = Sample(values, self.options)
+        result = self.func.evaluate(sample)
+
+        if not isinstance(result, Result):
+            raise TypeError("Cost function must return value of type Result")
+
+        return Evaluation(sample, result.value, result.extra)
+
+
+@define(slots=True, eq=False)
 class ParallelCostFuncWrapper(CostFuncWrapper[C, E]):
     """Wrapper to transform a `CostFunc` into an `ObjFunc`.
 
@@ -112,20 +173,71 @@ class ParallelCostFuncWrapper(CostFuncWrapper[C, E]):
 
     _pool: AbstractWorkerPool = field()
 
-    def eval_samples(self, samples: Iterable[SampleLike]) -> list[C]:
-        def eval_sample(sample: Sample) -> Evaluation[C, E]:
-            result = self._func.evaluate(sample)
+    def _evaluate(self, batch: list[SampleLike]) -> Iterable[Evaluation[C, E]]:
+        # The raw sample values are sent to the workers, which construct the Sample and Signals
+        # values themselves
+        eval_sample = _Evaluator(self._func, self._options)
 
-            if not isinstance(result, Result):
-                raise TypeError("Cost function must return value of type Result")
+        # Samples are dispatched to the workers in chunks to amortize the communication overhead,
+        # while leaving enough chunks per worker to balance uneven evaluation times
+        chunksize = max(1, len(batch) // (self._pool.nodes * 4))
+
+        # Results are consumed in order as the workers finish each chunk, so recording the
+        # evaluations overlaps with the evaluation of the remaining samples
+        return self._pool.imap(eval_sample, batch, chunksize=chunksize)
 
-            return Evaluation(sample, result.value, result.extra)
+    def _evaluate_cached(self, batch: list[SampleLike]) -> list[Evaluation[C, E]]:
+        keys = [_sample_key(values) for values in batch]
+        found: dict[tuple[float, ...], Evaluation[C, E]] = {}
+        missing: dict[tuple[float, ...], SampleLike] = {}
 
-        futures = self._pool.map(eval_sample, [Sample(s, self._options) for s in samples])
-        evaluations = list(futures)
-        self._evaluations.extend(evaluations)
+        for key, values in zip(keys, batch):
+            if key in found or key in missing:
+                continue
 
-        return [evaluation.cost for evaluation in evaluations]
+            evaluation = self._lookup(key)
+
+            if evaluation is None:
+                missing[key] = values
+            else:
+                found[key] = evaluation
+
+        # Only samples that have not been evaluated before are sent to the workers, and samples
+        # that are repeated within the batch are only evaluated once
+        for key, evaluation in zip(missing, self._evaluate(list(missing.values()))):
+            self._store(evaluation)
+            found[key] = evaluation
+
+        evaluations = []
+
+        for key, values in zip(keys, batch):
+            evaluation = found[key]
+
+            if key in missing:
+                del missing[key]
+            else:
+                evaluation = Evaluation(
+                    Sample(values, self._options), evaluation.cost, evaluation.extra
+                )
+
+            evaluations.append(evaluation)
+
+        return evaluations
+
+    def eval_samples(self, samples: Iterable[SampleLike]) -> list[C]:
+        batch = list(samples)
+        costs: list[C] = []
+
+        if self._options.cache_size:
+            evaluations: Iterable[Evaluation[C, E]] = self._evaluate_cached(batch)
+        else:
+            evaluations = self._evaluate(batch)
+
+        for evaluation in evaluations:
+            self._evaluations.append(evaluation)
+            costs.append(evaluation.cost)
+
+        return costs
 
 
 @frozen(slots=True)
@@ -138,6 +250,51 @@ class Run(Generic[R, C, E]):
 
     result: R
     evaluations: list[Evaluation[C, E]]
+    _extrema: tuple[Evaluation[C, E], Evaluation[C, E]] | None = field(
+        init=False, default=None, eq=False, repr=False
+    )
+
+    def _find_extrema(self: Run[R, CT, E]) -> tuple[Evaluation[CT, E], Evaluation[CT, E]]:
+        if self._extrema is None:
+            if not self.evaluations:
+                raise ValueError("Run does not contain any evaluations")
+
+            best = worst = self.evaluations[0]
+
+            # Both extremes are found in a single pass over the evaluations, keeping the first
+            # evaluation in case of ties to match the behavior of min and max
+            for evaluation in self.evaluations:
+                if evaluation.cost < best.cost:
+                    best = evaluation
+                elif worst.cost < evaluation.cost:
+                    worst = evaluation
+
+            # The class is frozen, so the cache slot has to be set directly
+            object.__setattr__(self, "_extrema", (best, worst))
+
+        return cast(tuple[Evaluation[CT, E], Evaluation[CT, E]], self._extrema)
+
+    @property
+    def best_eval(self: Run[R, CT, E]) -> Evaluation[CT, E]:
+        """The evaluation with the lowest cost.
+
+        The evaluation is only searched for on the first access and re-used afterwards.
+
+        :raises ValueError: If the run does not contain any evaluations
+        """
+
+        return self._find_extrema()[0]
+
+    @property
+    def worst_eval(self: Run[R, CT, E]) -> Evaluation[CT, E]:
+        """The evaluation with the highest cost.
+
+        The evaluation is only searched for on the first access and re-used afterwards.
+
+        :raises ValueError: If the run does not contain any evaluations
+        """
+
+        return self._find_extrema()[1]
 
 
 Runs: TypeAlias = list[Run[R, C, E]]
@@ -167,7 +324,7 @@ class _Parallelization:
         raise ValueError("Unknown kind")
 
 
-@frozen(slots=True)
+@frozen(slots=True, eq=False)
 class _TestContext(Generic[R, C, E]):
     func: CostFunc[C, E] = field()
     optimizer: Optimizer[C, R] = field()
@@ -217,7 +374,7 @@ def _make_bounds(options: TestOptions) -> list[Interval]:
     return bounds
 
 
-@define(slots=True)
+@define(slots=True, eq=False)
 class _TestContexts(Generic[R, C, E], Iterable[_TestContext[R, C, E]]):
     func: CostFunc[C, E]
     optimizer: Optimizer[C, R]
@@ -233,13 +390,16 @@ class _TestContexts(Generic[R, C, E], Iterable[_TestContext[R, C, E]]):
                 "Must provide at least one static input or at least one signal with at one or more control points"
             )
 
-        for _ in range(self.options.runs):
+        # Drawing every seed at once produces the same values as drawing them one at a time
+        seeds: list[int] = rng.integers(0, 2**32 - 1, size=self.options.runs).tolist()
+
+        for seed in seeds:
             yield _TestContext(
                 func=self.func,
                 optimizer=self.optimizer,
                 options=self.options,
                 bounds=bounds,
-                seed=rng.integers(0, 2**32 - 1),
+                seed=seed,
                 parallelization=self.parallelization,
             )
 
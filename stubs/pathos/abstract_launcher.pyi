@@ -5,4 +5,11 @@ _T = TypeVar("_T")
 _R = TypeVar("_R")
 
 class AbstractWorkerPool:
-    def map(self, func: Callable[[_T], _R], *args: Iterable[_T]) -> Iterable[_R]: ...
+    @property
+    def nodes(self) -> int: ...
+    def map(
+        self, func: Callable[[_T], _R], *args: Iterable[_T], chunksize: int | None = ...
+    ) -> Iterable[_R]: ...
+    def imap(
+        self, func: Callable[[_T], _R], *args: Iterable[_T], chunksize: int | None = ...
+    ) -> Iterable[_R]: ...
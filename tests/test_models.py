@@ -1,6 +1,7 @@
+import math
 from collections.abc import Iterable
 
-from pytest import fixture
+from pytest import approx, fixture
 
 from staliro import Result, Sample, Signal, SignalInput, TestOptions, Trace
 from staliro.models import Blackbox, Model, Ode, blackbox, model, ode
@@ -88,7 +89,53 @@ def test_blackbox(sample: Sample) -> None:
     }
 
 
+def test_blackbox_no_signals() -> None:
+    @blackbox(step_size=5.0)
+    def f(inputs: Blackbox.Inputs) -> Result[Trace[float], Blackbox.Inputs]:
+        return Result(Trace(times=[0], states=[0]), inputs)
+
+    options = TestOptions(static_inputs={"rho": (0, 5)}, tspan=(0, 10))
+    result = f.simulate(Sample([3.2], options))
+
+    assert result.extra.times == {0.0: {}, 5.0: {}, 10.0: {}}
+
+
 def test_ode(sample: Sample) -> None:
     @ode(method="RK45")
     def f(_: Ode.Inputs) -> dict[str, float]:
         raise NotImplementedError()
+
+
+def test_ode_simulate(sample: Sample) -> None:
+    @ode()
+    def f(inputs: Ode.Inputs) -> dict[str, float]:
+        assert isinstance(inputs.state["rho"], float)
+        return {"rho": inputs.signals["phi"]}
+
+    result = f.simulate(sample)
+    times = list(result.value.times)
+    states = list(result.value.states)
+
+    assert times[0] == 0.0
+    assert times[-1] == 10.0
+    assert states[0] == [3.2]
+    assert states[-1][0] == approx(3.2 - 50.0)
+
+
+def test_ode_jacobian(sample: Sample) -> None:
+    calls = 0
+
+    def jac(inputs: Ode.Inputs) -> list[list[float]]:
+        nonlocal calls
+        calls += 1
+        return [[-1.0]]
+
+    @ode(method="Radau", jac=jac)
+    def f(inputs: Ode.Inputs) -> dict[str, float]:
+        return {"rho": -inputs.state["rho"]}
+
+    result = f.simulate(sample)
+    states = list(result.value.states)
+
+    assert calls > 0
+    assert states[-1][0] == approx(3.2 * math.exp(-10), rel=1e-2)
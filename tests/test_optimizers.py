@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from staliro.cost_func import SampleLike
+from staliro.optimizers import DualAnnealing, ObjFunc, Optimizer, UniformRandom
+
+
+class Func(ObjFunc[float]):
+    def __init__(self) -> None:
+        self.samples: list[list[float]] = []
+
+    def eval_sample(self, sample: SampleLike) -> float:
+        self.samples.append(list(sample))
+        return sum(self.samples[-1])
+
+    def eval_samples(self, samples: Iterable[SampleLike]) -> Sequence[float]:
+        return [self.eval_sample(sample) for sample in samples]
+
+
+def test_uniform_random() -> None:
+    func = Func()
+    params = Optimizer.Params(seed=1234, budget=50, input_bounds=[(0.0, 1.0), (10.0, 20.0)])
+    UniformRandom[float]().optimize(func, params)
+
+    assert len(func.samples) == 50
+    assert all(0.0 <= s[0] <= 1.0 and 10.0 <= s[1] <= 20.0 for s in func.samples)
+
+    repeat = Func()
+    UniformRandom[float]().optimize(repeat, params)
+
+    assert repeat.samples == func.samples
+
+
+def test_uniform_random_falsification() -> None:
+    class Falsified(Func):
+        def eval_sample(self, sample: SampleLike) -> float:
+            super().eval_sample(sample)
+            return 1.0 if len(self.samples) < 10 else -1.0
+
+    func = Falsified()
+    params = Optimizer.Params(seed=1234, budget=50, input_bounds=[(0.0, 1.0)])
+    UniformRandom(min_cost=0.0).optimize(func, params)
+
+    assert len(func.samples) == 10
+
+
+def test_dual_annealing_falsification() -> None:
+    func = Func()
+    params = Optimizer.Params(seed=1234, budget=500, input_bounds=[(-1.0, 1.0)])
+    DualAnnealing(min_cost=0.0).optimize(func, params)
+
+    assert len(func.samples) < 500
+    assert min(sum(s) for s in func.samples) < 0.0
@@ -1,3 +1,4 @@
+import pickle
 from collections.abc import Iterable
 
 from numpy import array
@@ -74,3 +75,17 @@ def test_values() -> None:
 
     assert s1.values == [1, 2, 3, 4]
     assert s2.values == [4, 3, 2, 1]
+
+
+def test_pickle() -> None:
+    options = TestOptions(
+        tspan=(0, 10),
+        static_inputs={"a": (0, 1)},
+        signals={"s": SignalInput(control_points=[(0, 1), (0, 1)])},
+    )
+    sample = pickle.loads(pickle.dumps(Sample([0.5, 0.2, 0.8], options)))
+
+    assert sample.values == [0.5, 0.2, 0.8]
+    assert sample.static["a"] == 0.5
+    assert sample.signals.tspan == (0, 10)
+    assert sample.signals["s"].at_time(0.0) == 0.2
@@ -6,7 +6,15 @@ from unittest import TestCase
 import numpy as np
 import pandas as pd
 
-from staliro.signals import pchip, piecewise_constant
+from staliro.signals import (
+    clamped,
+    delayed,
+    harmonic,
+    pchip,
+    piecewise_constant,
+    piecewise_linear,
+    sequenced,
+)
 
 
 def _random(lower: float, upper: float, size: int) -> list[float]:
@@ -87,3 +95,60 @@ class PchipSignalTestCase(SignalTestCase):
         vector_sampled_points = signal.at_times(times)
 
         self.assertListEqual(single_sampled_points, vector_sampled_points)
+
+
+class SequencedSignalTestCase(SignalTestCase):
+    def test_switch(self) -> None:
+        factory = sequenced(piecewise_constant, piecewise_constant, t_switch=5.0)
+        signal = factory([0.0, 2.0, 4.0, 6.0, 8.0], [0.0, 1.0, 2.0, 3.0, 4.0])
+
+        self.assertEqual(signal.at_time(3.0), 1.0)
+        self.assertEqual(signal.at_time(7.0), 3.0)
+        self.assertEqual(signal.at_time(9.0), 4.0)
+
+    def test_single_vs_vectorized(self) -> None:
+        factory = sequenced(piecewise_constant, piecewise_linear, t_switch=5.0)
+        signal = factory([0.0, 2.0, 4.0, 6.0, 8.0], [0.0, 1.0, 2.0, 3.0, 4.0])
+        times = [7.0, 1.0, 4.5, 3.0, 6.5]
+
+        self.assertListEqual([signal.at_time(t) for t in times], signal.at_times(times))
+
+
+class DelayedSignalTestCase(SignalTestCase):
+    def test_single_vs_vectorized(self) -> None:
+        factory = delayed(piecewise_linear, delay=5.0)
+        signal = factory([0.0, 5.0, 10.0], [1.0, 2.0, 3.0])
+        times = [0.0, 4.9, 5.0, 7.5, 10.0]
+
+        self.assertListEqual([signal.at_time(t) for t in times], signal.at_times(times))
+
+
+class HarmonicSignalTestCase(SignalTestCase):
+    def test_single_vs_vectorized(self) -> None:
+        signal = harmonic([], [1.0, 2.0, 0.5, 0.1, 0.5, 3.0, 1.2])
+        times = _random(0, 10, 20)
+
+        np.testing.assert_allclose([signal.at_time(t) for t in times], signal.at_times(times))
+
+
+class ClampedSignalTestCase(SignalTestCase):
+    def test_zero_bounds(self) -> None:
+        factory = clamped(piecewise_constant, lo=0.0, hi=0.0)
+        signal = factory([0.0, 1.0], [-1.0, 1.0])
+
+        self.assertEqual(signal.at_time(0.5), 0.0)
+        self.assertEqual(signal.at_time(1.5), 0.0)
+
+    def test_unbounded(self) -> None:
+        factory = clamped(piecewise_constant, lo=None, hi=0.5)
+        signal = factory([0.0, 1.0], [-1.0, 1.0])
+
+        self.assertEqual(signal.at_time(0.5), -1.0)
+        self.assertEqual(signal.at_time(1.5), 0.5)
+
+    def test_single_vs_vectorized(self) -> None:
+        factory = clamped(pchip, lo=-0.5, hi=0.5)
+        signal = factory([0.0, 1.0, 2.0], [-1.0, 1.0, 0.0])
+        times = _random(0, 2, 10)
+
+        self.assertListEqual([signal.at_time(t) for t in times], signal.at_times(times))
@@ -31,3 +31,26 @@ def test_rtamt_discrete(trace: Trace[list[float]]) -> None:
 
 def test_rtamt_dense(trace: Trace[list[float]]) -> None:
     pytest.approx(rtamt.parse_dense(PHI, {"x1": 0}).evaluate(trace), EXPECTED, SIG_FIGS)
+
+
+def test_rtamt_reuse(trace: Trace[list[float]]) -> None:
+    spec = rtamt.parse_dense(PHI, {"x1": 0})
+    shifted = Trace(times=list(trace.times), states=[[s[0] + 5.0] for s in trace.states])
+    expected = spec.evaluate(trace).value
+
+    assert spec.evaluate(shifted).value != expected
+    assert spec.evaluate(trace).value == expected
+
+
+def test_rtamt_discrete_reuse(trace: Trace[list[float]]) -> None:
+    spec = rtamt.parse_discrete(PHI, {"x1": 0})
+    shifted = Trace(times=list(trace.times), states=[[s[0] + 5.0] for s in trace.states])
+    expected = spec.evaluate(trace).value
+
+    assert spec.evaluate(shifted).value != expected
+    assert spec.evaluate(trace).value == expected
+
+
+def test_rtamt_dense_syntax_error() -> None:
+    with pytest.raises(Exception, match="Syntax"):
+        rtamt.parse_dense("always (x1 >= ", {"x1": 0})
@@ -0,0 +1,140 @@
+import pickle
+
+import pytest
+from numpy.random import default_rng
+from pathos.pools import ThreadPool
+
+from staliro import TestOptions
+from staliro.cost_func import CostFunc, Result, Sample, costfunc
+from staliro.optimizers import UniformRandom
+from staliro.tests import (
+    CostFuncWrapper,
+    Evaluation,
+    ParallelCostFuncWrapper,
+    Run,
+    _Evaluator,
+    _TestContexts,
+)
+
+
+def test_evaluation_cache() -> None:
+    calls: list[list[float]] = []
+
+    @costfunc
+    def func(sample: Sample) -> Result[float, int]:
+        calls.append(sample.values)
+        return Result(sum(sample.values), len(calls))
+
+    options = TestOptions(static_inputs={"x": (0, 10), "y": (0, 10)}, cache_size=2)
+    wrapper = CostFuncWrapper(func, options)
+
+    assert wrapper.eval_samples([[1.0, 2.0], [3.0, 4.0], [1.0, 2.0]]) == [3.0, 7.0, 3.0]
+    assert calls == [[1.0, 2.0], [3.0, 4.0]]
+    assert [e.extra for e in wrapper._evaluations] == [1, 2, 1]
+
+    # [3.0, 4.0] is the least recently used evaluation and is evicted by the new sample
+    wrapper.eval_samples([[5.0, 6.0], [3.0, 4.0], [5.0, 6.0]])
+    assert calls[2:] == [[5.0, 6.0], [3.0, 4.0]]
+    assert len(wrapper._evaluations) == 6
+
+
+def test_evaluation_cache_disabled() -> None:
+    calls = 0
+
+    @costfunc
+    def func(sample: Sample) -> float:
+        nonlocal calls
+        calls += 1
+        return sum(sample.values)
+
+    wrapper = CostFuncWrapper(func, TestOptions(static_inputs={"x": (0, 10)}))
+    wrapper.eval_samples([[1.0], [1.0]])
+
+    assert calls == 2
+
+
+def test_parallel_evaluation_order() -> None:
+    @costfunc
+    def func(sample: Sample) -> float:
+        return sample.static["x"] * 2
+
+    wrapper = ParallelCostFuncWrapper(
+        func, TestOptions(static_inputs={"x": (0, 100)}), ThreadPool(nodes=2)
+    )
+    samples = [[float(i)] for i in range(50)]
+
+    assert wrapper.eval_samples(samples) == [2.0 * i for i in range(50)]
+    assert [e.sample.values for e in wrapper._evaluations] == samples
+
+
+def test_best_eval() -> None:
+    options = TestOptions(static_inputs={"x": (0, 10)})
+    evaluations = [Evaluation(Sample([x], options), x - 4.0, None) for x in [3.0, 1.0, 6.0]]
+    run = Run(None, evaluations)
+
+    assert run.best_eval is evaluations[1]
+    assert run.best_eval is evaluations[1]
+    assert run == Run(None, evaluations)
+    assert pickle.loads(pickle.dumps(run)).best_eval.cost == -3.0
+
+    with pytest.raises(ValueError):
+        _ = Run(None, []).best_eval
+
+
+def test_worst_eval() -> None:
+    options = TestOptions(static_inputs={"x": (0, 10)})
+    evaluations = [Evaluation(Sample([x], options), x - 4.0, None) for x in [3.0, 6.0, 1.0]]
+    run = Run(None, evaluations)
+
+    assert run.worst_eval is evaluations[1]
+    assert run.worst_eval is evaluations[1]
+
+    with pytest.raises(ValueError):
+        _ = Run(None, []).worst_eval
+
+
+def test_extrema_ties() -> None:
+    options = TestOptions(static_inputs={"x": (0, 10)})
+    evaluations = [Evaluation(Sample([x], options), 1.0, None) for x in [3.0, 6.0, 1.0]]
+    run = Run(None, evaluations)
+
+    assert run.best_eval is evaluations[0]
+    assert run.worst_eval is evaluations[0]
+
+
+class Double(CostFunc[float, None]):
+    def evaluate(self, sample: Sample) -> Result[float, None]:
+        return Result(sample.static["x"] * 2, None)
+
+
+def test_evaluator_pickle() -> None:
+    evaluator = _Evaluator(Double(), TestOptions(static_inputs={"x": (0, 10)}))
+    evaluation = pickle.loads(pickle.dumps(evaluator))([3.0])
+
+    assert evaluation.cost == 6.0
+    assert evaluation.sample.values == [3.0]
+
+
+def test_parallel_evaluation_cache() -> None:
+    calls: list[list[float]] = []
+
+    @costfunc
+    def func(sample: Sample) -> float:
+        calls.append(sample.values)
+        return sample.static["x"] * 2
+
+    options = TestOptions(static_inputs={"x": (0, 100)}, cache_size=10)
+    wrapper = ParallelCostFuncWrapper(func, options, ThreadPool(nodes=2))
+
+    assert wrapper.eval_samples([[1.0], [2.0], [1.0]]) == [2.0, 4.0, 2.0]
+    assert wrapper.eval_samples([[2.0], [3.0]]) == [4.0, 6.0]
+    assert sorted(calls) == [[1.0], [2.0], [3.0]]
+    assert [e.sample.values for e in wrapper._evaluations] == [[1.0], [2.0], [1.0], [2.0], [3.0]]
+
+
+def test_context_seeds() -> None:
+    options = TestOptions(static_inputs={"x": (0, 10)}, runs=5, seed=1234)
+    contexts = _TestContexts(Double(), UniformRandom(), options, None)
+    rng = default_rng(1234)
+
+    assert [ctx.seed for ctx in contexts] == [rng.integers(0, 2**32 - 1) for _ in range(5)]
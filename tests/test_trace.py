@@ -12,9 +12,15 @@ def test_from_times_states() -> None:
     t2 = Trace(times=np.array([1.0, 2.0, 3.0]), states=["foo", "bar", "baz"])
     assert t2.elements == SortedDict({1.0: "foo", 2.0: "bar", 3.0: "baz"})
 
+    t3 = Trace(times=np.array([1, 2, 3]), states=["foo", "bar", "baz"])
+    assert all(type(time) is float for time in t3.times)
+
     with pytest.raises(TypeError):
         Trace(times=[[1.0], [2.0], [3.0]], states=(1, 2, 3))  # type: ignore
 
+    with pytest.raises(TypeError):
+        Trace(times=np.array([[1.0], [2.0], [3.0]]), states=(1, 2, 3))
+
 
 def test_from_states() -> None:
     t = Trace({1.0: "a", 2.0: "b", 3.0: "c"})
@@ -53,6 +59,7 @@ def test_eq() -> None:
     t2 = Trace({3.0: "c", 1.0: "a", 2.0: "b"})
     t3 = Trace({3.0: "c", 1.0: "a", 2.0: "b"})
 
+    assert t1 == t1
     assert t2 == t3
     assert t1 != t2
 